@@ -1,41 +1,170 @@
 import serial
 import time
+import re
+import os
+import sys
+import selectors
+import struct
 import dearpygui.dearpygui as dpg
 import threading
 from serial.tools import list_ports
 import logging
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+import queue
+import atexit
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from array import array
+from collections import deque
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that buffers writes and flushes at most once per flush_interval."""
+
+    def __init__(self, filename, *args, flush_interval=1.0, buffer_size=65536, **kwargs):
+        self.buffer_size = buffer_size  # Read by _open, which the base __init__ calls
+        super().__init__(filename, *args, **kwargs)
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+        # Track the size ourselves: the base class seeks/tells per record, which flushes the buffer
+        self.file_size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _open(self):
+        # newline="\n" keeps the bytes on disk equal to the encoded message on every platform
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding,
+                    errors=self.errors, newline="\n")
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))  # maxBytes counts bytes
+            if self.maxBytes > 0 and self.file_size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.file_size += size
+            if time.monotonic() - self.last_flush >= self.flush_interval:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.file_size = 0
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        super().flush()
+
+
+class FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers once the queue has been idle for flush_interval."""
+
+    def __init__(self, log_queue, *handlers, flush_interval=1.0, **kwargs):
+        super().__init__(log_queue, *handlers, **kwargs)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                # Nothing arrived for a while: push out whatever the handlers still buffer
+                for handler in self.handlers:
+                    handler.flush()
+
+    def enqueue_sentinel(self):
+        # The queue is bounded; wait for the listener to make room rather than failing on a full queue
+        self.queue.put(self._sentinel, timeout=5.0)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of raising when its bounded queue is full."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
 
 # Logging Configuration
 log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("SerialPlotter")
 logger.setLevel(logging.DEBUG)
 
-file_handler = RotatingFileHandler("serial_plotter.log", maxBytes=1_000_000, backupCount=5)
+file_handler = BufferedRotatingFileHandler("serial_plotter.log", maxBytes=1_000_000, backupCount=5)
 file_handler.setFormatter(log_formatter)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
-logger.addHandler(console_handler)
+
+# Handlers run on a listener thread so logging never blocks the serial reader on I/O
+# The queue is bounded so a stalled listener cannot grow memory without limit
+log_queue = queue.Queue(maxsize=10_000)
+logger.addHandler(DroppingQueueHandler(log_queue))
+log_listener = FlushingQueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on any exit path
 
 # Global variables
 selected_port = None
 selected_baud_rate = 9600
-channel_data = {}  # Store data for each channel
-channel_values = {}  # Latest channel values for display
-non_numeric_data = []
-stop_thread = False
-serial_connection = None
+baud_rates = {str(rate): rate for rate in (9600, 19200, 38400, 57600, 115200)}  # Combo text -> baud rate
+no_ports_item = "No ports available"  # Placeholder shown in the port combo
+channel_data = {}  # Preallocated ring of the last max_points samples for each channel, stored twice
+channel_counts = {}  # Total samples written to each channel's ring
+channel_names = []  # "Channel N" labels by index, built once per channel
+channel_lock = threading.Lock()  # Guards the rings and counts between the reader and the GUI
+channel_values = {}  # Latest value of each channel: received token bytes, or a float from binary frames
+non_numeric_data = deque(maxlen=10)  # Latest visible non-numeric entries
+non_numeric_text = ""  # non_numeric_data joined for the text box
+non_numeric_changed = False  # Set when the text box needs a refresh
+bad_line_count = 0  # Lines that failed processing since the last warning
+last_bad_line_log = float("-inf")  # Monotonic time of the last processing warning
+timestamp_cache = ["", 0]  # Formatted timestamp and the whole second it was made for
+stop_event = threading.Event()  # Set to stop the current reader thread
+max_retries = 5  # Connection attempts before giving up
+binary_frames = False  # Expect binary frames (0xAA, count, count x float32 LE) instead of CSV text
+frame_sync = 0xAA  # First byte of every binary frame
+max_frame_channels = 5  # Largest channel count accepted in a binary frame (one per plotted series)
 selected_channels = []
 max_points = 100  # Limit points displayed in the graph
+last_draw = 0.0  # Monotonic time of the last plot redraw
+draw_interval = 0.1  # Minimum seconds between plot redraws
+last_value_draw = 0.0  # Monotonic time of the last channel value label refresh
+value_interval = 0.5  # Minimum seconds between channel value label refreshes
+drawn_values = {}  # Channel value text currently shown in each label
+drawn_counts = {}  # Sample count of each channel when its series was last pushed
+series_ids = {}  # DPG item id of each channel's line series
+value_label_ids = {}  # DPG item id of each channel's value label
+non_numeric_box_id = None  # DPG item id of the non-numeric text box
+status_label_id = None  # DPG item id of the status label
+pending_status = None  # Latest (status, color) for the status label
+shown_status = None  # (status, color) the status label currently shows
+shown_status_color = None  # Color of the theme bound to the status label
+status_themes = {}  # Text color theme for each status color, created on first use
+x_axis_cache = list(range(max_points))  # X values shared by every channel series
+port_cache = {"time": float("-inf"), "ports": []}  # Last port scan and when it ran
+port_cache_ttl = 2.0  # Seconds a port scan is reused
+number_syntax = rb"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"  # Signed decimal or scientific value
+numeric_pattern = re.compile(rb"^%s$" % number_syntax)
+numeric_line_pattern = re.compile(rb"^\s*%s\s*(?:,\s*%s\s*)*$" % (number_syntax, number_syntax))
 
 
 def detect_serial_ports():
-    """Detect available serial ports."""
+    """Detect available serial ports, reusing a scan made in the last port_cache_ttl seconds."""
+    now = time.monotonic()
+    if now - port_cache["time"] < port_cache_ttl:
+        return port_cache["ports"]
+
     logger.info("Detecting available serial ports.")
-    return [port.device for port in list_ports.comports()]
+    port_cache["ports"] = [port.device for port in list_ports.comports()]
+    port_cache["time"] = now
+    return port_cache["ports"]
 
 
 def refresh_ports():
@@ -46,120 +175,376 @@ def refresh_ports():
         dpg.configure_item("start_button", enabled=True)
         update_status("Select a serial port to connect.", (255, 255, 0))
     else:
-        dpg.configure_item("port_combo", items=["No ports available"], default_value="No ports available")
+        dpg.configure_item("port_combo", items=[no_ports_item], default_value=no_ports_item)
         dpg.configure_item("start_button", enabled=False)
         update_status("No ports detected. Refresh to try again.", (255, 0, 0))
 
 
 def update_status(status, color):
-    """Update status message and color."""
-    dpg.set_value("status_label", status)
-    dpg.configure_item("status_label", color=color)
+    """Set the status message and color; the GUI thread shows it on the next frame."""
+    global pending_status
+    pending_status = (status, color)  # A single assignment, so safe from the reader thread
+
+
+def update_reader_status(reader_event, status, color):
+    """Set the status from a reader thread, unless a newer Start has replaced that reader."""
+    if reader_event is stop_event:
+        update_status(status, color)
+
+
+def status_theme(color):
+    """Return a theme that draws text in color, creating it once per color."""
+    theme = status_themes.get(color)
+    if theme is None:
+        with dpg.theme() as theme:
+            with dpg.theme_component(dpg.mvText):
+                dpg.add_theme_color(dpg.mvThemeCol_Text, color)
+        status_themes[color] = theme
+    return theme
+
+
+def redraw_status():
+    """Show the latest status message if it changed since the last frame."""
+    global shown_status, shown_status_color
+
+    status = pending_status
+    if status is not shown_status:
+        shown_status = status
+        dpg.set_value(status_label_id, status[0])
+        # Most updates keep the same color, so only rebind the theme when it changes
+        if status[1] != shown_status_color:
+            shown_status_color = status[1]
+            dpg.bind_item_theme(status_label_id, status_theme(status[1]))
 
 
 def on_port_selected(sender, app_data):
     global selected_port
-    selected_port = app_data
+    selected_port = None if app_data == no_ports_item else app_data
     logger.info(f"Port selected: {selected_port}")
 
 
+def on_binary_frames_selected(sender, app_data):
+    global binary_frames
+    binary_frames = app_data
+    logger.info(f"Binary frames selected: {binary_frames}")
+
+
 def on_baud_rate_selected(sender, app_data):
     global selected_baud_rate
-    selected_baud_rate = int(app_data)
+    selected_baud_rate = baud_rates[app_data]
     logger.info(f"Baud rate selected: {selected_baud_rate}")
 
 
+def on_redraw_rate_selected(sender, app_data):
+    global draw_interval
+    draw_interval = 1.0 / max(app_data, 1.0)  # Typed-in values can bypass the slider range
+    logger.info(f"Max redraw rate selected: {app_data} Hz")
+
+
 def on_channel_selection(sender, app_data):
     global selected_channels
     selected_channels = app_data
+    drawn_counts.clear()  # Push the newly selected series on the next redraw
     logger.info(f"Channels selected: {selected_channels}")
 
 
 def start_reading_data():
     """Start the thread for reading serial data."""
-    global stop_thread, serial_connection
+    global stop_event
 
     if not selected_port:
         update_status("No serial port selected!", (255, 0, 0))
         return
 
-    stop_thread = False
-    threading.Thread(target=read_from_arduino, daemon=True).start()
+    # Each reader gets its own event so a reader that is still stopping is never revived
+    stop_event.set()  # Stop the previous reader, if any, so it never holds the port alongside the new one
+    stop_event = threading.Event()
+    threading.Thread(target=read_from_arduino, args=(stop_event,), daemon=True).start()
 
 
 def stop_reading_data():
     """Stop reading data."""
-    global stop_thread, serial_connection
-    stop_thread = True
-    if serial_connection:
-        serial_connection.close()
+    # The reader closes its own connection once it sees the event, so a read is never cut off mid-call
+    stop_event.set()
     update_status("Disconnected", (255, 0, 0))
 
 
-def read_from_arduino():
+def open_serial_connection(stop_event):
+    """Open the selected port, retrying with exponential backoff; returns None if stopped."""
+    attempt = 0
+    while True:
+        try:
+            # A short timeout lets reads block in the OS while still noticing stop_event
+            return serial.Serial(selected_port, selected_baud_rate, timeout=0.2)
+        except serial.SerialException as e:
+            attempt += 1
+            if attempt >= max_retries:
+                raise
+
+            delay = min(2 ** attempt, 30)
+            logger.warning("Connection to %s failed (%s), retrying in %d s", selected_port, e, delay)
+            update_reader_status(stop_event, f"Connection failed, retrying in {delay} s...", (255, 255, 0))
+            if stop_event.wait(delay):  # Returns early when Stop is pressed
+                return None
+
+
+def read_available(connection, selector):
+    """Return the bytes waiting on connection, blocking up to its timeout when idle."""
+    if selector is None:
+        # Drain everything already received in one call; block for one byte when idle
+        return connection.read(max(1, connection.in_waiting))
+
+    # POSIX: one readiness wait and one read per batch, without pyserial's in_waiting ioctl
+    if not selector.select(timeout=connection.timeout):
+        return b""
+    try:
+        chunk = os.read(connection.fileno(), 4096)
+    except BlockingIOError:
+        return b""
+    except OSError as e:
+        raise serial.SerialException(f"read failed: {e}")
+    if not chunk:  # Readable but empty means the device went away
+        raise serial.SerialException("device reports readiness to read but returned no data")
+    return chunk
+
+
+def read_from_arduino(stop_event):
     """Read serial data and update GUI."""
-    global stop_thread, serial_connection, channel_data, non_numeric_data
+    global channel_data, non_numeric_data
 
+    connection = None
+    selector = None
     try:
-        serial_connection = serial.Serial(selected_port, selected_baud_rate, timeout=1)
-        update_status(f"Connected to {selected_port} at {selected_baud_rate} baud", (0, 255, 0))
-        logger.info(f"Connected to {selected_port}")
+        connection = open_serial_connection(stop_event)
+        if connection is None:
+            return
+
+        # Linux only: drop the USB-serial latency timer (16 ms on FTDI) so bytes reach us sooner
+        if sys.platform.startswith("linux"):
+            try:
+                connection.set_low_latency_mode(True)
+            except (OSError, ValueError, NotImplementedError) as e:
+                logger.debug("Low latency mode unavailable on %s: %s", selected_port, e)
 
-        while not stop_thread:
-            if serial_connection.in_waiting > 0:
-                line = serial_connection.readline().decode('utf-8').strip()
-                logger.debug(f"Received data: {line}")
+        # No settle delay after opening: drop stale bytes and start reading straight away
+        connection.reset_input_buffer()
 
-                if line:  # Ignore empty lines
-                    process_received_data(line)
+        update_reader_status(stop_event, f"Connected to {selected_port} at {selected_baud_rate} baud", (0, 255, 0))
+        logger.info(f"Connected to {selected_port}")
+
+        if os.name == "posix":
+            selector = selectors.DefaultSelector()
+            selector.register(connection.fileno(), selectors.EVENT_READ)
+
+        binary = binary_frames  # The wire format is fixed for the life of the connection
+        synced = binary  # Binary frames resync on their start byte
+        buffer = bytearray()
+        while not stop_event.is_set():
+            chunk = read_available(connection, selector)
+            if not chunk:  # Timed out
+                continue
+
+            buffer.extend(chunk)
+            if binary:
+                process_binary_frames(buffer)
+                continue
+
+            if not synced:
+                # The flush can land mid-line, so drop everything up to the first newline we see
+                start = buffer.find(b"\n")
+                if start < 0:
+                    buffer.clear()
+                    continue
+                del buffer[:start + 1]
+                synced = True
+
+            end = buffer.rfind(b"\n")
+            if end < 0:  # No complete line yet
+                continue
+
+            # Split every complete line at once; the trailing partial line stays buffered
+            lines = bytes(buffer[:end]).split(b"\n")
+            del buffer[:end + 1]
+            for raw in lines:
+                # Stay in bytes; only non-numeric text is decoded later
+                line = raw.strip()
+                if not line:  # Ignore empty lines
+                    continue
+
+                logger.debug("Received data: %s", line)
+                process_received_data(line)
 
     except serial.SerialException as e:
         logger.error(f"Serial error: {e}")
     finally:
-        if serial_connection:
-            serial_connection.close()
-        update_status("Disconnected", (255, 0, 0))
+        if selector:
+            selector.close()
+        if connection:
+            connection.close()
+        update_reader_status(stop_event, "Disconnected", (255, 0, 0))
+
+
+def redraw_plots():
+    """Push buffered channel data and non-numeric text to the plot and text box."""
+    global non_numeric_changed
+
+    # Snapshot the dict: the reader thread may add channels while we draw
+    for channel_name, data in list(channel_data.items()):
+        series_id = series_ids.get(channel_name)
+        if series_id is not None and channel_name in selected_channels:
+            # Copy the window under the lock so the reader is never blocked while we build lists
+            with channel_lock:
+                count = channel_counts[channel_name]
+                if drawn_counts.get(channel_name) == count:  # No new samples since the last push
+                    continue
+                if count < max_points:
+                    window = data[:count]
+                else:
+                    # The mirrored half makes the oldest-first window one contiguous slice
+                    head = count % max_points
+                    window = data[head:head + max_points]
+
+            drawn_counts[channel_name] = count
+            x_data = x_axis_cache if count >= max_points else x_axis_cache[:count]
+            dpg.set_value(series_id, (x_data, window.tolist()))
+
+    if non_numeric_changed:
+        non_numeric_changed = False
+        dpg.set_value(non_numeric_box_id, non_numeric_text)
+
+
+def redraw_values():
+    """Refresh channel value labels whose latest value has changed."""
+    for channel_name, value in list(channel_values.items()):
+        label_id = value_label_ids.get(channel_name)
+        if label_id is not None and drawn_values.get(channel_name) != value:
+            drawn_values[channel_name] = value
+            # Text frames keep the received token; binary frames store the float itself
+            text = value.decode('ascii') if isinstance(value, bytes) else f"{value:g}"
+            dpg.set_value(label_id, f"{channel_name}: {text}")
+
+
+def pump_gui():
+    """Redraw from the GUI thread at the selected rate; the reader makes no DPG calls."""
+    global last_draw, last_value_draw
+
+    now = time.monotonic()
+    # Hold DPG's lock once for the whole batch instead of once per set_value
+    with dpg.mutex():
+        redraw_status()
+
+        if now - last_draw >= draw_interval:
+            last_draw = now
+            redraw_plots()
+
+        # Labels are read by eye, so they refresh on a slower tick than the plot
+        if now - last_value_draw >= value_interval:
+            last_value_draw = now
+            redraw_values()
+
+
+def current_timestamp():
+    """Return the current time as text, formatting at most once per second."""
+    now = int(time.time())
+    if now != timestamp_cache[1]:
+        timestamp_cache[0] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        timestamp_cache[1] = now
+    return timestamp_cache[0]
+
+
+def store_channel_value(index, number, text):
+    """Append a parsed value to its channel buffer; the caller holds channel_lock."""
+    while len(channel_names) <= index:
+        channel_names.append(f"Channel {len(channel_names) + 1}")
+    channel_name = channel_names[index]
+
+    data = channel_data.get(channel_name)
+    if data is None:
+        data = channel_data[channel_name] = array("d", bytes(16 * max_points))
+        channel_counts[channel_name] = 0
+
+    # Overwrite the oldest slot instead of shifting the window, and its mirror in the second half
+    count = channel_counts[channel_name]
+    slot = count % max_points
+    data[slot] = number
+    data[slot + max_points] = number
+    channel_counts[channel_name] = count + 1
+    channel_values[channel_name] = text
+
+
+def process_binary_frames(buffer):
+    """Store every complete binary frame in buffer and remove the consumed bytes."""
+    start = 0
+    while True:
+        sync = buffer.find(frame_sync, start)
+        if sync < 0:  # Nothing to resync on; drop the noise
+            start = len(buffer)
+            break
+
+        # A frame is the sync byte, a channel count, then one little-endian float32 per channel
+        if sync + 2 > len(buffer):
+            start = sync
+            break
+        count = buffer[sync + 1]
+        if not 0 < count <= max_frame_channels:  # 0xAA inside a payload, not a frame start
+            start = sync + 1
+            continue
+
+        end = sync + 2 + 4 * count
+        if end > len(buffer):  # Frame not complete yet
+            start = sync
+            break
+
+        numbers = struct.unpack_from(f"<{count}f", buffer, sync + 2)
+        with channel_lock:
+            for i, number in enumerate(numbers):
+                store_channel_value(i, number, number)  # Formatted on the GUI thread
+        start = end
+
+    del buffer[:start]
 
 
 def process_received_data(line):
-    """Process incoming serial data."""
-    global channel_data, non_numeric_data, channel_values
+    """Process an incoming serial line given as raw bytes."""
+    global channel_data, non_numeric_data, channel_values, non_numeric_text, non_numeric_changed
+    global bad_line_count, last_bad_line_log
 
     try:
-        parts = line.split(",")
-
-        # Parse numeric channels
-        for i, value in enumerate(parts):
-            if value.replace(".", "", 1).isdigit():
-                channel_name = f"Channel {i + 1}"
-                if channel_name not in channel_data:
-                    channel_data[channel_name] = []
-
-                channel_data[channel_name].append(float(value))
-                channel_values[channel_name] = value
-
-                # Limit points to max_points
-                if len(channel_data[channel_name]) > max_points:
-                    channel_data[channel_name].pop(0)
-
-                # Update plot data
-                if channel_name in selected_channels:
-                    x_data = list(range(len(channel_data[channel_name])))
-                    y_data = channel_data[channel_name]
-                    dpg.set_value(f"{channel_name}_series", (x_data, y_data))
-
-                # Update latest value
-                dpg.set_value(f"{channel_name}_value", f"{channel_name}: {value}")
-
-            else:  # Non-numeric data
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                non_numeric_data.append(f"[{timestamp}] {value}")
-                if len(non_numeric_data) > 10:  # Limit visible non-numeric entries
-                    non_numeric_data.pop(0)
-                dpg.set_value("non_numeric_data_box", "\n".join(non_numeric_data))
+        parts = line.split(b",")
+
+        # Fast path: one regex scan decides the whole frame with the same rule as single tokens
+        if numeric_line_pattern.match(line):
+            numbers = list(map(float, parts))
+            with channel_lock:
+                for i, number in enumerate(numbers):
+                    store_channel_value(i, number, parts[i].strip())
+        else:
+            # Mixed frame: classify each token on its own
+            for i, value in enumerate(parts):
+                value = value.strip()
+                if numeric_pattern.match(value):
+                    with channel_lock:
+                        store_channel_value(i, float(value), value)
+
+                else:  # Non-numeric data
+                    entry = f"[{current_timestamp()}] {value.decode('utf-8', 'replace')}"
+                    evicting = len(non_numeric_data) == non_numeric_data.maxlen
+                    non_numeric_data.append(entry)  # The deque drops the oldest entry itself
+                    if evicting:
+                        non_numeric_text = "\n".join(non_numeric_data)
+                    else:
+                        non_numeric_text = f"{non_numeric_text}\n{entry}" if non_numeric_text else entry
+                    non_numeric_changed = True
 
     except Exception as e:
-        logger.warning(f"Error processing data: {line} -> {e}")
+        # Report at most once per second so a garbage stream cannot flood the log
+        bad_line_count += 1
+        now = time.monotonic()
+        if now - last_bad_line_log >= 1.0:
+            logger.warning("Error processing data (%d lines since last report), latest: %s -> %s",
+                           bad_line_count, line, e)
+            bad_line_count = 0
+            last_bad_line_log = now
 
 
 def exit_application():
@@ -168,36 +553,53 @@ def exit_application():
 
 
 def start_gui():
+    global non_numeric_box_id, status_label_id
+
     dpg.create_context()
 
     with dpg.window(label="Arduino Multi-Channel Monitor", width=700, height=800):
         dpg.add_combo(detect_serial_ports(), label="Serial Port", callback=on_port_selected, tag="port_combo")
-        dpg.add_combo([9600, 19200, 38400, 57600, 115200], label="Baud Rate", callback=on_baud_rate_selected)
+        dpg.add_combo(list(baud_rates), label="Baud Rate", callback=on_baud_rate_selected)
+        dpg.add_checkbox(label="Binary Frames", default_value=binary_frames, callback=on_binary_frames_selected)
         dpg.add_button(label="Start Reading", callback=start_reading_data, tag="start_button")
         dpg.add_button(label="Stop Reading", callback=stop_reading_data)
-        dpg.add_text("Status: Not Connected", tag="status_label", color=(255, 0, 0))
+        status_label_id = dpg.add_text("Status: Not Connected", tag="status_label")
 
         dpg.add_listbox(["Channel 1", "Channel 2", "Channel 3"], label="Channels", callback=on_channel_selection,
                         tag="channel_listbox", width=400, num_items=3)
+        dpg.add_slider_float(label="Max Redraw Rate Hz", default_value=1.0 / draw_interval, min_value=1.0,
+                             max_value=60.0, clamped=True, callback=on_redraw_rate_selected, width=400)
 
         with dpg.plot(label="Multi-Channel Data Plot", height=400, width=600):
-            dpg.add_plot_axis(dpg.mvXAxis, label="Time")
+            # The window always spans max_points samples, so fix X instead of autoscaling it every frame
+            x_axis = dpg.add_plot_axis(dpg.mvXAxis, label="Time")
+            dpg.set_axis_limits(x_axis, 0, max_points - 1)
             dpg.add_plot_axis(dpg.mvYAxis, label="Value", tag="y_axis")
+            # Keep the returned ids so redraws skip the tag lookup
             for i in range(5):
-                dpg.add_line_series([], [], parent="y_axis", label=f"Channel {i + 1}", tag=f"Channel {i + 1}_series")
+                series_ids[f"Channel {i + 1}"] = dpg.add_line_series([], [], parent="y_axis", label=f"Channel {i + 1}",
+                                                                     tag=f"Channel {i + 1}_series")
 
         dpg.add_text("Channel Values:")
         for i in range(5):
-            dpg.add_text(f"Channel {i + 1}: 0", tag=f"Channel {i + 1}_value")
+            value_label_ids[f"Channel {i + 1}"] = dpg.add_text(f"Channel {i + 1}: 0", tag=f"Channel {i + 1}_value")
 
         dpg.add_separator()
         dpg.add_text("Non-Numeric Data:")
-        dpg.add_input_text(tag="non_numeric_data_box", multiline=True, width=600, height=150, readonly=True)
+        non_numeric_box_id = dpg.add_input_text(tag="non_numeric_data_box", multiline=True, width=600, height=150,
+                                                readonly=True)
+
+    update_status("Status: Not Connected", (255, 0, 0))
 
     dpg.create_viewport(title="Arduino Multi-Channel Serial Monitor", width=700, height=800)
     dpg.setup_dearpygui()
     dpg.show_viewport()
-    dpg.start_dearpygui()
+
+    # Render frames manually so widget updates happen on this thread
+    while dpg.is_dearpygui_running():
+        pump_gui()
+        dpg.render_dearpygui_frame()
+
     dpg.destroy_context()
 
 